@@ -0,0 +1,166 @@
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+
+from src.core.schema import Validator, compile_schema, report_violations, validate, validate_stream
+
+# Response contracts, declared once per endpoint and keyed by (METHOD, path).
+# Each one is compiled on first use and the validator is kept in _validators.
+
+_ECHO_BASE = {
+    "args": {"type": "object", "additionalProperties": {"type": ["string", "array"]}},
+    "headers": {"type": "object", "additionalProperties": {"type": "string"}},
+    "origin": {"type": "string"},
+    "url": {"type": "string"},
+}
+
+CONTRACTS: Dict[Tuple[str, str], Dict[str, Any]] = {
+    ("GET", "/get"): {
+        "type": "object",
+        "required": ["args", "headers", "origin", "url"],
+        "properties": _ECHO_BASE,
+    },
+    ("POST", "/post"): {
+        "type": "object",
+        "required": ["args", "data", "files", "form", "headers", "json", "origin", "url"],
+        "properties": {
+            **_ECHO_BASE,
+            "data": {"type": "string"},
+            "files": {"type": "object"},
+            "form": {"type": "object"},
+            "json": {"type": ["object", "array", "string", "number", "boolean", "null"]},
+        },
+    },
+    ("GET", "/json"): {
+        "type": "object",
+        "required": ["slideshow"],
+        "properties": {
+            "slideshow": {
+                "type": "object",
+                "required": ["title", "slides"],
+                "properties": {
+                    "author": {"type": "string"},
+                    "date": {"type": "string"},
+                    "title": {"type": "string"},
+                    "slides": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "required": ["title", "type"],
+                            "properties": {
+                                "title": {"type": "string"},
+                                "type": {"type": "string"},
+                                "items": {"type": "array", "items": {"type": "string"}},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+    ("GET", "/headers"): {
+        "type": "object",
+        "required": ["headers"],
+        "properties": {"headers": _ECHO_BASE["headers"]},
+    },
+    ("GET", "/user-agent"): {
+        "type": "object",
+        "required": ["user-agent"],
+        "properties": {"user-agent": {"type": "string"}},
+    },
+    ("GET", "/uuid"): {
+        "type": "object",
+        "required": ["uuid"],
+        "properties": {"uuid": {"type": "string"}},
+    },
+    # Each line of /stream/{n} is a /get-like document with an extra "id"
+    ("GET", "/stream"): {
+        "type": "object",
+        "required": ["id", "args", "headers", "origin", "url"],
+        "properties": {**_ECHO_BASE, "id": {"type": "integer"}},
+    },
+}
+
+
+_validators: Dict[Tuple[str, str], Validator] = {}
+
+
+def get_contract(method: str, path: str) -> Dict[str, Any]:
+    """
+    Returns the response schema registered for an endpoint.
+
+    Args:
+        method: HTTP method ("get", "post", ...), case-insensitive.
+        path: Endpoint path as registered in CONTRACTS (e.g. "/get").
+
+    Returns:
+        Dict[str, Any]: JSON-schema-like dictionary.
+
+    Raises:
+        KeyError: If no contract is declared for the endpoint.
+    """
+    key = (method.upper(), path)
+    if key not in CONTRACTS:
+        raise KeyError(f"No response contract declared for {key[0]} {path}")
+    return CONTRACTS[key]
+
+
+def get_validator(method: str, path: str) -> Validator:
+    """
+    Returns the compiled validator for an endpoint contract, compiling it
+    on the first call only.
+
+    Args:
+        method: HTTP method ("get", "post", ...), case-insensitive.
+        path: Endpoint path as registered in CONTRACTS (e.g. "/get").
+
+    Returns:
+        Validator: Compiled validator for the endpoint.
+    """
+    key = (method.upper(), path)
+    validator = _validators.get(key)
+    if validator is None:
+        validator = compile_schema(get_contract(method, path))
+        _validators[key] = validator
+    return validator
+
+
+def assert_contract(response: requests.Response, method: str, path: str) -> None:
+    """
+    Asserts that a JSON response body matches the contract of its endpoint.
+    On failure only the list of violations is attached to Allure.
+
+    Args:
+        response: Response returned by HttpClient.request().
+        method: HTTP method the contract is registered under.
+        path: Endpoint path the contract is registered under.
+    """
+    violations = validate(response.json(), get_validator(method, path))
+    report_violations(f"{method.upper()} {path}", violations)
+
+
+def assert_stream_contract(
+    response: requests.Response,
+    method: str,
+    path: str,
+    expected_count: Optional[int] = None,
+) -> None:
+    """
+    Validates a newline-delimited JSON response line by line against the
+    contract of its endpoint. For the body to be validated while it is being
+    downloaded, request it with HttpClient.request(..., stream=True).
+    The response is closed afterwards, as the stream can only be read once.
+
+    Args:
+        response: Response returned by HttpClient.request().
+        method: HTTP method the contract is registered under.
+        path: Endpoint path the contract is registered under.
+        expected_count: If given, the number of documents the body must contain.
+    """
+    try:
+        violations = validate_stream(
+            response.iter_lines(), get_validator(method, path), expected_count=expected_count
+        )
+    finally:
+        response.close()
+    report_violations(f"{method.upper()} {path}", violations)
@@ -32,6 +32,8 @@ class HttpClient:
             method: HTTP method ("get", "post", "put", etc.).
             path: Endpoint path appended to base_url.
             **kwargs: Additional parameters passed to requests (params, json, headers, etc.).
+                With stream=True the body is not downloaded up front and is not
+                attached to Allure, so it can be consumed incrementally.
 
         Returns:
             requests.Response: Response object returned by the server.
@@ -39,6 +41,7 @@ class HttpClient:
         url = self.base_url + path
         timeout = kwargs.pop("timeout", cfg.timeout)
         verify = kwargs.pop("verify", cfg.verify_ssl)
+        stream = kwargs.get("stream", False)
 
         log.debug(f"{method.upper()} {url} | kwargs={kwargs}")
 
@@ -70,7 +73,9 @@ class HttpClient:
                 "url": resp.url,
             }
             attach_text("HTTP response meta", json.dumps(resp_info, indent=2))
-            attach_text("HTTP response body", resp.text)
+            # Reading resp.text would buffer a streamed body before the caller sees it
+            if not stream:
+                attach_text("HTTP response body", resp.text)
         except Exception as e:
             log.warning(f"Failed to attach response to Allure: {e}")
 
@@ -0,0 +1,206 @@
+import os
+import json
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import get_context, resource_tracker, shared_memory
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.core import data_factory
+from src.core.data_factory import UserPayload
+from src.core.logger import get_logger
+
+log = get_logger("cpu_pool")
+
+# Bodies at least this large are handed to workers through shared memory
+# instead of being pickled into the task queue.
+SHARED_MEMORY_THRESHOLD = 1024 * 1024
+
+# (shared memory block name, body size) or the raw bytes for small bodies
+BodyRef = Tuple[str, int] | bytes
+
+
+def _load_json(ref: BodyRef) -> Any:
+    """Decodes a JSON body from a BodyRef, reading shared memory in place."""
+    if isinstance(ref, bytes):
+        return json.loads(ref)
+    name, size = ref
+    # The parent owns the block; attaching registers it with the same
+    # resource tracker, which is a no-op for an already tracked name.
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        with shm.buf[:size] as view:
+            return json.loads(str(view, "utf-8"))
+    finally:
+        shm.close()
+
+
+def json_diff(expected: Any, actual: Any, path: str = "$") -> List[str]:
+    """
+    Deep-compares two decoded JSON values.
+
+    Args:
+        expected: Expected value.
+        actual: Actual value.
+        path: JSON path prefix used in messages.
+
+    Returns:
+        List[str]: Differences, e.g. "$.user.name: expected 'Ann', got 'Bob'".
+    """
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        diffs = []
+        for key in expected.keys() - actual.keys():
+            diffs.append(f"{path}.{key}: missing")
+        for key in actual.keys() - expected.keys():
+            diffs.append(f"{path}.{key}: unexpected")
+        for key in expected.keys() & actual.keys():
+            diffs.extend(json_diff(expected[key], actual[key], f"{path}.{key}"))
+        return sorted(diffs)
+
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return [f"{path}: expected {len(expected)} items, got {len(actual)}"]
+        diffs = []
+        for index, (exp_item, act_item) in enumerate(zip(expected, actual)):
+            diffs.extend(json_diff(exp_item, act_item, f"{path}[{index}]"))
+        return diffs
+
+    if type(expected) is not type(actual) or expected != actual:
+        return [f"{path}: expected {expected!r}, got {actual!r}"]
+    return []
+
+
+def _compare_echo(expected_ref: BodyRef, body_ref: BodyRef, field: Optional[str]) -> List[str]:
+    expected = _load_json(expected_ref)
+    body = _load_json(body_ref)
+    if field is not None:
+        if not isinstance(body, dict):
+            return [f"$: expected object with field {field!r}, got {type(body).__name__}"]
+        if field not in body:
+            return [f"$.{field}: missing"]
+        body = body[field]
+    return json_diff(expected, body)
+
+
+def _generate_user_rows(count: int) -> List[Tuple[str, ...]]:
+    # Tuples pickle much smaller than dataclass instances
+    return [data_factory.generate_user_payload().to_row() for _ in range(count)]
+
+
+class CpuPool:
+    """
+    Session-wide ProcessPoolExecutor for CPU-bound test work (payload
+    generation, deep comparison of JSON bodies), so it does not hold the GIL
+    while HTTP requests run in threads. Safe to use from several threads.
+
+    Workers are started with the "spawn" method: forking a process that
+    already runs I/O threads can copy locks held by those threads.
+
+    Attributes:
+        max_workers: Number of worker processes.
+        executor: Underlying ProcessPoolExecutor, created on first use.
+    """
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self.executor is None:
+                log.debug(f"Starting process pool with {self.max_workers} worker(s)")
+                # Workers must share the parent's resource tracker. Otherwise the
+                # first worker to attach a block starts its own tracker, which
+                # reports the block as leaked and unlinks it a second time.
+                # The tracker only exists on POSIX.
+                if os.name == "posix":
+                    resource_tracker.ensure_running()
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=get_context("spawn"),
+                )
+            return self.executor
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Schedules a picklable, module-level callable in a worker process.
+
+        Args:
+            fn: Function to execute.
+            *args: Positional arguments passed to fn.
+            **kwargs: Keyword arguments passed to fn.
+
+        Returns:
+            Future: Future holding the function result.
+        """
+        return self._get_executor().submit(fn, *args, **kwargs)
+
+    def _share(self, body: bytes) -> BodyRef:
+        """Places a large body in shared memory; small bodies are passed as-is."""
+        if len(body) < SHARED_MEMORY_THRESHOLD:
+            return body
+        shm = shared_memory.SharedMemory(create=True, size=len(body))
+        shm.buf[:len(body)] = body
+        self._blocks[shm.name] = shm
+        return shm.name, len(body)
+
+    def _release(self, ref: BodyRef) -> None:
+        if isinstance(ref, bytes):
+            return
+        shm = self._blocks.pop(ref[0], None)
+        if shm is not None:
+            shm.close()
+            shm.unlink()
+
+    def compare_echo(self, expected_body: bytes, body: bytes, field: Optional[str] = None) -> List[str]:
+        """
+        Decodes two JSON bodies and deep-compares them in a worker process,
+        e.g. the request body sent to /post vs. the "json" field it echoes.
+        Both bodies travel as raw bytes (through shared memory when large),
+        so nothing is re-serialized or pickled as Python objects.
+
+        Args:
+            expected_body: Expected JSON as bytes (e.g. response.request.body).
+            body: Raw JSON body bytes (e.g. response.content).
+            field: Optional top-level field of the body to compare against.
+
+        Returns:
+            List[str]: Differences, empty if the values are equal.
+        """
+        expected_ref = self._share(expected_body)
+        try:
+            body_ref = self._share(body)
+            try:
+                return self.submit(_compare_echo, expected_ref, body_ref, field).result()
+            finally:
+                self._release(body_ref)
+        finally:
+            self._release(expected_ref)
+
+    def generate_user_payloads(self, count: int) -> List[UserPayload]:
+        """
+        Generates user payloads across all worker processes.
+
+        Args:
+            count: Number of payloads to generate.
+
+        Returns:
+            List[UserPayload]: Generated payloads.
+        """
+        chunk = max(1, -(-count // self.max_workers))
+        sizes = [min(chunk, count - start) for start in range(0, count, chunk)]
+        futures = [self.submit(_generate_user_rows, size) for size in sizes]
+        return [UserPayload.from_row(row) for f in futures for row in f.result()]
+
+    def shutdown(self) -> None:
+        """
+        Stops worker processes and frees any leftover shared memory blocks.
+        """
+        with self._lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=True, cancel_futures=True)
+                self.executor = None
+        for shm in list(self._blocks.values()):
+            shm.close()
+            shm.unlink()
+        self._blocks.clear()
@@ -1,6 +1,6 @@
 from faker import Faker
-from dataclasses import dataclass, asdict
-from typing import Dict, Any
+from dataclasses import dataclass, asdict, astuple
+from typing import Dict, Any, Tuple
 
 _fake = Faker(locale="en_US")
 
@@ -22,6 +22,15 @@ class UserPayload:
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
+    def to_row(self) -> Tuple[str, ...]:
+        """Compact tuple form, cheap to pickle between processes."""
+        return astuple(self)
+
+    @classmethod
+    def from_row(cls, row: Tuple[str, ...]) -> "UserPayload":
+        """Restores a payload from the tuple produced by to_row()."""
+        return cls(*row)
+
 
 def generate_user_payload() -> UserPayload:
     """
@@ -56,6 +56,11 @@ def retry(
                     # If the wrapped function returns a Response (HTTP), inspect status
                     status = getattr(result, "status_code", None)
                     if status is not None and status in retry_on_status:
+                        # Discarded response: release its pooled connection now,
+                        # a streamed body would otherwise hold it until GC
+                        close = getattr(result, "close", None)
+                        if close is not None:
+                            close()
                         raise RuntimeError(f"retryable status {status}")
 
                     if attempt > 1:
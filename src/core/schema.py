@@ -0,0 +1,308 @@
+import json
+import hashlib
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from src.core.allure_utils import attach_text
+from src.core.logger import get_logger
+
+log = get_logger("schema")
+
+Validator = Callable[[Any, str, List[str]], None]
+Schema = Dict[str, Any]
+
+# Max number of violations kept in a report, so Allure gets a compact diff
+# instead of a full dump of a broken response.
+MAX_VIOLATIONS = 20
+
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+_JSON_TYPE_NAMES = {
+    dict: "object",
+    list: "array",
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    type(None): "null",
+}
+
+_KEYWORDS = frozenset(
+    {"type", "properties", "required", "additionalProperties", "items", "enum", "const"}
+)
+
+_cache: Dict[str, Validator] = {}
+
+
+class _Stop(Exception):
+    """Internal signal to skip remaining checks for a node."""
+
+
+def _type_name(value: Any) -> str:
+    return _JSON_TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+def schema_hash(schema: Dict[str, Any]) -> str:
+    """
+    Returns a stable hash of a schema, used as the validator cache key.
+
+    Args:
+        schema: JSON-schema-like dictionary.
+
+    Returns:
+        str: SHA-256 hex digest of the canonical JSON form of the schema.
+    """
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _compile(schema: Union[Schema, bool]) -> Validator:
+    """
+    Turns a schema into a chain of small closures. All keyword lookups happen
+    here once, so validating a document only runs the checks that apply.
+    """
+    if schema is True:
+        return lambda value, path, errors: None
+
+    if schema is False:
+
+        def reject(value, path, errors):
+            errors.append(f"{path}: no value allowed")
+
+        return reject
+
+    if not isinstance(schema, dict):
+        raise ValueError(f"Schema must be an object or a boolean, got {_type_name(schema)}")
+
+    unknown_keywords = sorted(schema.keys() - _KEYWORDS)
+    if unknown_keywords:
+        raise ValueError(f"Unsupported schema keyword(s): {unknown_keywords}")
+
+    checks: List[Validator] = []
+
+    expected_type = schema.get("type")
+    if expected_type is not None:
+        names = [expected_type] if isinstance(expected_type, str) else list(expected_type)
+        unknown = [n for n in names if n not in _TYPE_CHECKS]
+        if unknown:
+            raise ValueError(f"Unsupported schema type(s): {unknown}")
+        type_checks = [_TYPE_CHECKS[n] for n in names]
+        expected = " | ".join(names)
+
+        def check_type(value, path, errors):
+            if not any(check(value) for check in type_checks):
+                errors.append(f"{path}: expected {expected}, got {_type_name(value)}")
+                raise _Stop
+
+        checks.append(check_type)
+
+    if "const" in schema:
+        const = schema["const"]
+
+        def check_const(value, path, errors):
+            if value != const:
+                errors.append(f"{path}: expected {const!r}, got {value!r}")
+
+        checks.append(check_const)
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+
+        def check_enum(value, path, errors):
+            if value not in allowed:
+                errors.append(f"{path}: {value!r} is not one of {allowed!r}")
+
+        checks.append(check_enum)
+
+    required = list(schema.get("required", ()))
+    properties = {
+        key: compile_schema(sub) for key, sub in schema.get("properties", {}).items()
+    }
+    additional = schema.get("additionalProperties", True)
+    additional_validator = None if isinstance(additional, bool) else compile_schema(additional)
+
+    if required or properties or additional is not True:
+
+        def check_object(value, path, errors):
+            if not isinstance(value, dict):
+                return
+            for key in required:
+                if key not in value:
+                    errors.append(f"{path}.{key}: missing required field")
+            for key, item in value.items():
+                validator = properties.get(key)
+                if validator is not None:
+                    validator(item, f"{path}.{key}", errors)
+                elif additional is False:
+                    errors.append(f"{path}.{key}: unexpected field")
+                elif additional_validator is not None:
+                    additional_validator(item, f"{path}.{key}", errors)
+
+        checks.append(check_object)
+
+    if "items" in schema:
+        item_validator = compile_schema(schema["items"])
+
+        def check_items(value, path, errors):
+            if not isinstance(value, list):
+                return
+            for index, item in enumerate(value):
+                item_validator(item, f"{path}[{index}]", errors)
+
+        checks.append(check_items)
+
+    def run_checks(value, path, errors):
+        try:
+            for check in checks:
+                check(value, path, errors)
+        except _Stop:
+            # Type mismatch: further checks on this node would only add noise
+            pass
+
+    return run_checks
+
+
+def compile_schema(schema: Union[Schema, bool]) -> Validator:
+    """
+    Compiles a schema into a validator callable. The schema is hashed only
+    here, so equal schemas compiled twice share one validator; callers that
+    validate repeatedly should keep the returned validator and reuse it.
+
+    Supported keywords: type, properties, required, additionalProperties,
+    items, enum, const. Subschemas may also be True (anything) or False
+    (nothing).
+
+    Args:
+        schema: JSON-schema-like dictionary, or a boolean schema.
+
+    Returns:
+        Validator: Callable (value, path, errors) that appends violations to errors.
+
+    Raises:
+        ValueError: If the schema uses an unsupported keyword or type, so that
+            no part of a contract is silently left unchecked.
+    """
+    key = schema_hash(schema)
+    validator = _cache.get(key)
+    if validator is None:
+        validator = _compile(schema)
+        _cache[key] = validator
+    return validator
+
+
+def _as_validator(schema: Union[Schema, bool, Validator]) -> Validator:
+    return schema if callable(schema) else compile_schema(schema)
+
+
+def validate(value: Any, schema: Union[Schema, Validator]) -> List[str]:
+    """
+    Validates a decoded JSON document against a schema.
+
+    Args:
+        value: Decoded JSON value (dict, list, str, ...).
+        schema: Schema dictionary or a validator returned by compile_schema().
+
+    Returns:
+        List[str]: Human-readable violations, empty if the value is valid.
+    """
+    errors: List[str] = []
+    _as_validator(schema)(value, "$", errors)
+    return errors
+
+
+def validate_stream(
+    lines: Iterable[Any],
+    schema: Union[Schema, Validator],
+    expected_count: Optional[int] = None,
+    max_violations: int = MAX_VIOLATIONS,
+) -> List[str]:
+    """
+    Validates newline-delimited JSON (e.g. httpbin /stream/{n}) one document
+    at a time while the lines are being consumed. Pass an unbuffered source,
+    such as iter_lines() of a response requested with stream=True, to avoid
+    holding the whole body in memory. Once max_violations is reached the
+    remaining documents are only counted if expected_count is given, and
+    not read at all otherwise.
+
+    Args:
+        lines: Iterable of str/bytes lines, e.g. response.iter_lines().
+        schema: Schema dictionary or a validator returned by compile_schema().
+        expected_count: If given, the number of documents the stream must contain.
+        max_violations: Upper bound on collected violations.
+
+    Returns:
+        List[str]: Violations prefixed with the document index (blank lines
+            are not counted), e.g. "$[2].id: ...". A document count mismatch
+            is always reported, as the first entry.
+    """
+    validator = _as_validator(schema)
+    errors: List[str] = []
+    count = 0
+
+    for line in lines:
+        if not line or not line.strip():
+            continue
+        path = f"$[{count}]"
+        count += 1
+        if len(errors) >= max_violations:
+            # Budget is full: only keep counting documents for expected_count
+            continue
+        try:
+            document = json.loads(line)
+        except ValueError as e:
+            errors.append(f"{path}: invalid JSON ({e})")
+        else:
+            validator(document, path, errors)
+        if len(errors) >= max_violations and expected_count is None:
+            break
+
+    errors = errors[:max_violations]
+    if expected_count is not None and count != expected_count:
+        # Listed first so it is never cut off by the violation budget
+        errors = [f"$: expected {expected_count} documents, got {count}"] + errors[:max_violations - 1]
+
+    return errors
+
+
+def report_violations(name: str, violations: List[str]) -> None:
+    """
+    Fails with a compact list of violations, also attached to Allure.
+    Does nothing if the list is empty.
+
+    Args:
+        name: Label used in the Allure attachment and assertion message.
+        violations: Violations from validate() or validate_stream().
+    """
+    if not violations:
+        return
+
+    shown = violations[:MAX_VIOLATIONS]
+    hidden = len(violations) - len(shown)
+    diff = "\n".join(shown)
+    if hidden > 0:
+        diff += f"\n... and {hidden} more"
+
+    log.debug(f"Schema violations in {name}:\n{diff}")
+    attach_text(f"Schema violations: {name}", diff)
+
+    raise AssertionError(f"{name} does not match schema:\n{diff}")
+
+
+def assert_schema(value: Any, schema: Union[Schema, Validator], name: str = "response") -> None:
+    """
+    Asserts that a value matches a schema. On failure, only a compact list of
+    violations (not the full body) is attached to Allure.
+
+    Args:
+        value: Decoded JSON value to validate.
+        schema: Schema dictionary or a validator returned by compile_schema().
+        name: Label used in the Allure attachment and assertion message.
+    """
+    report_violations(name, validate(value, schema))
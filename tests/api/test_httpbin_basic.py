@@ -4,6 +4,7 @@ import uuid
 import pytest
 import allure
 
+from src.api.contracts import assert_contract, assert_stream_contract
 from src.core.httpbin_guard import assert_or_xfail_service_unavailable
 
 
@@ -25,6 +26,7 @@ def test_get_echoes_query_params(http, random_query):
             name="GET /get body",
             attachment_type=allure.attachment_type.JSON,
         )
+        assert_contract(response, "get", "/get")
         assert body["args"] == random_query
 
 
@@ -48,6 +50,7 @@ def test_post_json_echoes_body(http, user_payload):
             name="POST /post body",
             attachment_type=allure.attachment_type.JSON,
         )
+        assert_contract(response, "post", "/post")
         assert body["json"] == payload
 
 
@@ -81,15 +84,8 @@ def test_response_format_json(http):
         )
         assert "application/json" in content_type
 
-    with allure.step("Verify body is a JSON object and contains 'slideshow' field"):
-        body = response.json()
-        allure.attach(
-            json.dumps(body, indent=2),
-            name="JSON body",
-            attachment_type=allure.attachment_type.JSON,
-        )
-        assert isinstance(body, dict)
-        assert "slideshow" in body
+    with allure.step("Verify body matches the GET /json contract"):
+        assert_contract(response, "get", "/json")
 
 
 @allure.feature("Response formats")
@@ -157,6 +153,7 @@ def test_request_inspection_headers(http):
             name="Response JSON",
             attachment_type=allure.attachment_type.JSON,
         )
+        assert_contract(response, "get", "/headers")
         assert echoed_value == "aqa-home-assignment"
 
 
@@ -181,6 +178,7 @@ def test_request_inspection_user_agent(http):
             name="GET /user-agent body",
             attachment_type=allure.attachment_type.JSON,
         )
+        assert_contract(response, "get", "/user-agent")
         assert body["user-agent"] == user_agent
 
 
@@ -199,6 +197,10 @@ def test_dynamic_uuid(http):
         assert_or_xfail_service_unavailable(response_1)
         assert_or_xfail_service_unavailable(response_2)
 
+    with allure.step("Verify both responses match the GET /uuid contract"):
+        assert_contract(response_1, "get", "/uuid")
+        assert_contract(response_2, "get", "/uuid")
+
     with allure.step("Extract UUIDs from both responses"):
         uuid_1 = response_1.json()["uuid"]
         uuid_2 = response_2.json()["uuid"]
@@ -218,3 +220,42 @@ def test_dynamic_uuid(http):
 
     with allure.step("Verify UUIDs are different (dynamic data)"):
         assert uuid_1 != uuid_2
+
+
+@allure.feature("Dynamic data")
+@allure.story("Streamed JSON lines")
+@pytest.mark.api
+def test_stream_json_lines(http):
+    """
+    Verify that GET /stream/{n} returns n newline-delimited JSON documents,
+    each matching the stream contract.
+    """
+    lines_count = 3
+
+    with allure.step(f"Send GET /stream/{lines_count} without buffering the body"):
+        response = http.request("get", f"/stream/{lines_count}", stream=True)
+        assert_or_xfail_service_unavailable(response)
+
+    with allure.step(f"Validate {lines_count} streamed documents against the contract"):
+        assert_stream_contract(response, "get", "/stream", expected_count=lines_count)
+
+
+@allure.feature("Request inspection")
+@allure.story("POST /post echoes a batch of users")
+@pytest.mark.api
+def test_post_batch_json_echoes_body(http, cpu_pool):
+    """
+    Verify that POST /post echoes a batch of users unchanged. Payload
+    generation and the deep comparison run in the process pool; the
+    shared-memory path for large bodies is covered by tests/core.
+    """
+    with allure.step("Generate 50 user payloads in worker processes"):
+        payload = [user.to_dict() for user in cpu_pool.generate_user_payloads(50)]
+
+    with allure.step("Send POST /post with the batch"):
+        response = http.request("post", "/post", json=payload)
+        assert_or_xfail_service_unavailable(response)
+
+    with allure.step("Deep-compare echoed JSON with the sent body"):
+        diffs = cpu_pool.compare_echo(response.request.body, response.content, field="json")
+        assert not diffs, "\n".join(diffs[:20])
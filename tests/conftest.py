@@ -3,6 +3,7 @@ import pytest
 from src.api.http import HttpClient
 from src.core import data_factory
 from src.core.allure_utils import attach_text
+from src.core.cpu_pool import CpuPool
 
 
 @pytest.fixture(scope="session")
@@ -13,6 +14,17 @@ def http():
     return HttpClient()
 
 
+@pytest.fixture(scope="session")
+def cpu_pool():
+    """
+    Provides a shared process pool for CPU-bound work and stops it
+    after the test session.
+    """
+    pool = CpuPool()
+    yield pool
+    pool.shutdown()
+
+
 @pytest.fixture
 def user_payload():
     """
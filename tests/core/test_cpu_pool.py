@@ -0,0 +1,152 @@
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+from multiprocessing import shared_memory
+from pathlib import Path
+
+import pytest
+
+from src.core import cpu_pool as cpu_pool_module
+from src.core.cpu_pool import CpuPool, json_diff
+from src.core.data_factory import UserPayload
+
+ROOT = Path(__file__).resolve().parents[2]
+
+LARGE_BODY = json.dumps({"json": {"blob": "x" * cpu_pool_module.SHARED_MEMORY_THRESHOLD}}).encode()
+LARGE_EXPECTED = json.dumps({"blob": "x" * cpu_pool_module.SHARED_MEMORY_THRESHOLD}).encode()
+
+
+@pytest.fixture(scope="module")
+def pool():
+    pool = CpuPool(max_workers=2)
+    yield pool
+    pool.shutdown()
+
+
+def test_json_diff_reports_paths():
+    """Differences are reported per JSON path, including type mismatches."""
+    expected = {"name": "Ann", "tags": ["a", "b"], "age": 1}
+    actual = {"name": "Bob", "tags": ["a"], "age": True, "extra": 1}
+    assert json_diff(expected, actual) == [
+        "$.age: expected 1, got True",
+        "$.extra: unexpected",
+        "$.name: expected 'Ann', got 'Bob'",
+        "$.tags: expected 2 items, got 1",
+    ]
+
+
+def test_compare_echo_uses_field(pool):
+    """The echoed field of a /post-like body is compared with the request body."""
+    sent = json.dumps({"name": "Ann", "city": "Paris"}).encode()
+    body = json.dumps({"json": json.loads(sent), "url": "x"}).encode()
+    assert pool.compare_echo(sent, body, field="json") == []
+    assert pool.compare_echo(b'{"name": "Bob"}', body, field="json") != []
+
+
+def test_compare_echo_non_object_body(pool):
+    """A body that is not a JSON object yields a diff instead of an error."""
+    assert pool.compare_echo(b"{}", b"[1, 2]", field="json") == [
+        "$: expected object with field 'json', got list",
+    ]
+
+
+def test_compare_echo_releases_shared_memory(pool, monkeypatch):
+    """Large bodies go through shared memory blocks that are unlinked afterwards."""
+    created = []
+    original = shared_memory.SharedMemory
+
+    def recording_shared_memory(*args, **kwargs):
+        shm = original(*args, **kwargs)
+        if kwargs.get("create"):
+            created.append(shm.name)
+        return shm
+
+    monkeypatch.setattr(cpu_pool_module.shared_memory, "SharedMemory", recording_shared_memory)
+
+    assert pool.compare_echo(LARGE_EXPECTED, LARGE_BODY, field="json") == []
+
+    assert len(created) == 2
+    for name in created:
+        with pytest.raises(FileNotFoundError):
+            original(name=name)
+
+
+def test_shared_memory_path_prints_nothing_to_stderr():
+    """
+    Worker and resource tracker output goes to the real stderr of the
+    process, so the shared-memory path is exercised in a subprocess.
+    """
+    script = textwrap.dedent("""
+        from src.core.cpu_pool import CpuPool, SHARED_MEMORY_THRESHOLD
+
+        body = b'"' + b"x" * SHARED_MEMORY_THRESHOLD + b'"'
+        pool = CpuPool(max_workers=2)
+        # Small task first, so workers start before any block exists
+        assert pool.compare_echo(b"1", b"1") == []
+        for _ in range(2):
+            assert pool.compare_echo(body, body) == []
+        pool.shutdown()
+    """)
+    python_path = os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=ROOT,
+        env={**os.environ, "PYTHONPATH": python_path},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stderr == ""
+
+
+def test_executor_is_created_once_across_threads():
+    """Concurrent first submissions from I/O threads share one single-worker pool."""
+    pool = CpuPool(max_workers=1)
+    pids = []
+    barrier = threading.Barrier(8)
+
+    def first_use():
+        barrier.wait()
+        pids.append(pool.submit(os.getpid).result())
+
+    threads = [threading.Thread(target=first_use) for _ in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(set(pids)) == 1
+    finally:
+        pool.shutdown()
+
+
+def test_resource_tracker_is_started_only_on_posix(monkeypatch):
+    """Windows has no resource tracker, so the pool must not try to start one."""
+    started = []
+
+    class _Executor:
+        def __init__(self, **kwargs):
+            pass
+
+        def submit(self, fn, *args, **kwargs):
+            return None
+
+    monkeypatch.setattr(cpu_pool_module.os, "name", "nt")
+    monkeypatch.setattr(cpu_pool_module.resource_tracker, "ensure_running", lambda: started.append(True))
+    monkeypatch.setattr(cpu_pool_module, "ProcessPoolExecutor", _Executor)
+
+    CpuPool(max_workers=1).submit(os.getpid)
+
+    assert started == []
+
+
+def test_generate_user_payloads(pool):
+    """Payloads generated in workers come back as UserPayload instances."""
+    payloads = pool.generate_user_payloads(10)
+    assert len(payloads) == 10
+    assert all(isinstance(p, UserPayload) for p in payloads)
+    assert len({p.email for p in payloads}) > 1
@@ -0,0 +1,24 @@
+from src.core.retry import retry
+
+
+class _FakeResponse:
+    def __init__(self, status_code: int):
+        self.status_code = status_code
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_retryable_response_is_closed_before_retry():
+    """A response discarded because of a retryable status releases its connection."""
+    responses = [_FakeResponse(503), _FakeResponse(200)]
+    calls = iter(responses)
+
+    @retry(attempts=2, delay_ms=1, retry_on_status=[503], jitter_ms=0)
+    def send():
+        return next(calls)
+
+    assert send() is responses[1]
+    assert responses[0].closed
+    assert not responses[1].closed
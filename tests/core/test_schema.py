@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+from src.core import schema
+
+USER_SCHEMA = {
+    "type": "object",
+    "required": ["name", "email"],
+    "additionalProperties": False,
+    "properties": {
+        "name": {"type": "string"},
+        "email": {"type": "string"},
+        "age": {"type": "integer"},
+        "tags": {"type": "array", "items": {"type": "string"}},
+    },
+}
+
+
+def test_valid_document_has_no_violations():
+    """A document matching the schema produces no violations."""
+    doc = {"name": "Ann", "email": "ann@example.com", "age": 30, "tags": ["a"]}
+    assert schema.validate(doc, USER_SCHEMA) == []
+
+
+def test_violations_are_reported_with_paths():
+    """Each violation points to the offending JSON path."""
+    doc = {"name": 1, "age": True, "tags": ["a", 2], "extra": None}
+    assert schema.validate(doc, USER_SCHEMA) == [
+        "$.email: missing required field",
+        "$.name: expected string, got integer",
+        "$.age: expected integer, got boolean",
+        "$.tags[1]: expected string, got integer",
+        "$.extra: unexpected field",
+    ]
+
+
+def test_compiled_validator_is_cached_by_schema_content():
+    """Equal schemas share one compiled validator regardless of key order."""
+    reordered = dict(reversed(list(USER_SCHEMA.items())))
+    assert schema.compile_schema(USER_SCHEMA) is schema.compile_schema(reordered)
+
+
+def test_validate_stream_checks_each_line():
+    """Newline-delimited documents are validated one by one."""
+    lines = [
+        json.dumps({"name": "Ann", "email": "a@example.com"}).encode(),
+        b"",
+        json.dumps({"name": "Bob"}).encode(),
+        b"{not json",
+    ]
+    violations = schema.validate_stream(lines, USER_SCHEMA, expected_count=2)
+    assert violations[0] == "$: expected 2 documents, got 3"
+    assert violations[1] == "$[1].email: missing required field"
+    assert violations[2].startswith("$[2]: invalid JSON")
+
+
+def test_validate_stream_consumes_lines_lazily():
+    """Each line is validated before the next one is read."""
+    seen = []
+
+    def lines():
+        for index in range(3):
+            seen.append(index)
+            yield json.dumps({"name": "Ann"})
+
+    violations = schema.validate_stream(lines(), USER_SCHEMA, max_violations=1)
+    assert violations == ["$[0].email: missing required field"]
+    assert seen == [0]
+
+
+def test_compiled_validator_can_be_passed_directly():
+    """A validator from compile_schema() is accepted in place of the schema."""
+    validator = schema.compile_schema(USER_SCHEMA)
+    assert schema.validate({"name": "Ann"}, validator) == ["$.email: missing required field"]
+
+
+def test_assert_schema_truncates_long_diffs():
+    """Only MAX_VIOLATIONS entries are listed in the assertion message."""
+    doc = {"tags": list(range(schema.MAX_VIOLATIONS + 5))}
+    with pytest.raises(AssertionError) as exc_info:
+        schema.assert_schema(doc, USER_SCHEMA, name="user")
+    assert "... and 7 more" in str(exc_info.value)
+
+
+def test_validate_stream_reports_count_when_budget_is_full():
+    """A document count mismatch is reported even if per-document errors fill the budget."""
+    lines = [json.dumps({"name": "Ann"}) for _ in range(3)]
+    violations = schema.validate_stream(lines, USER_SCHEMA, expected_count=5, max_violations=3)
+    assert violations == [
+        "$: expected 5 documents, got 3",
+        "$[0].email: missing required field",
+        "$[1].email: missing required field",
+    ]
+
+
+@pytest.mark.parametrize("unsupported", [
+    {"type": "string", "minLength": 5},
+    {"type": "object", "properties": {"id": {"type": "string", "pattern": "^z"}}},
+    {"items": {"$ref": "#/definitions/item"}},
+])
+def test_unsupported_keywords_are_rejected(unsupported):
+    """Keywords outside the supported set fail at compile time instead of being ignored."""
+    with pytest.raises(ValueError, match="Unsupported schema keyword"):
+        schema.compile_schema(unsupported)
+
+
+def test_boolean_subschemas():
+    """True accepts any value and False rejects every value."""
+    assert schema.validate([1, "a", None], {"items": True}) == []
+    assert schema.validate([1], {"items": False}) == ["$[0]: no value allowed"]
+    assert schema.validate({"a": 1}, {"additionalProperties": {"type": "string"}}) == [
+        "$.a: expected string, got integer",
+    ]